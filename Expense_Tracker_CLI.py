@@ -2,8 +2,13 @@
 # 1) Imports
 # ===================
 
-import json                                  # Provides JSON load/dump so we can save and load expenses from a .json file
+import json                                  # Provides JSON encode/decode so we can save and load expenses, one JSON object per line
+import os                                    # Provides os.replace to swap the saved file in atomically
+import re                                    # Provides the precompiled pattern that checks typed amounts
 from pathlib import Path                     # Provides Path objects for clean, cross-platform file paths
+from types import MappingProxyType           # Read-only dict view used to freeze the command tables
+from functools import lru_cache              # Remembers results of year_month() for date strings already seen
+from dataclasses import dataclass, field     # Builds the slotted Expense record class
 from datetime import date, timedelta         # date gives today's date; timedelta is imported but not used yet (can be removed)
 
 # ===================
@@ -13,46 +18,31 @@ from datetime import date, timedelta         # date gives today's date; timedelt
 APP_NAME = "Expense Tracker CLI"            # Name shown in the menu header
 APP_VERSION = "0.1.0"                       # Version shown in the menu header
 
-EXPENSE_FILE = Path("expenses.json")        # Path object pointing to the JSON file where expenses are stored
-
-INIT_COMMANDS = {                           # Maps user input strings to standardized "main menu" actions
-    "a": "add",                             # Shortcut key for add action
-    "add": "add",                           # Text command for add action
-    "add expense": "add",                   # Alternate text command for add action
-    "b": "delete",                          # Shortcut key for delete action
-    "delete": "delete",                     # Text command for delete action
-    "delete expense": "delete",             # Alternate text command for delete action
-    "c": "report",                          # Shortcut key for report action
-    "report": "report",                     # Text command for report action
-    "report expenses": "report",            # Alternate text command for report action
-    "see expenses": "report",               # Alternate text command for report action
-    "view expenses": "report",              # Alternate text command for report action
-    "d": "exit",                            # Shortcut key for exit action
-    "exit": "exit",                         # Text command for exit action
-}
+EXPENSE_FILE = Path("expenses.jsonl")       # Path object pointing to the JSON Lines file where expenses are stored
+EXPENSE_TMP_FILE = EXPENSE_FILE.with_suffix(".jsonl.tmp")  # Scratch file a full rewrite goes to before it replaces EXPENSE_FILE
+LEGACY_EXPENSE_FILE = Path("expenses.json") # Older single-JSON-document file; converted to EXPENSE_FILE on first load
+JSON_SEPARATORS = (",", ":")                # Compact separators so each saved line stays short
 
-ADD_COMMANDS = {                            # Maps user input strings to standardized actions in the "Add Expense" submenu
-    "a": "add",                             # Shortcut key to add an expense
-    "add": "add",                           # Text command to add an expense
-    "add expense": "add",                   # Alternate text command to add an expense
-    "b": "back",                            # Shortcut key to go back to main menu
-    "back": "back",                         # Text command to go back
-    "go back": "back",                      # Alternate text command to go back
-}
+def build_commands(aliases_by_action):       # Flattens {action: (aliases...)} into a frozen {alias: action} lookup table
+    return MappingProxyType({alias: action for action, aliases in aliases_by_action.items() for alias in aliases})
 
-DEL_COMMANDS = {                            # Maps user input strings to standardized actions in the "Delete Expense" submenu
-    "a": "delete",                          # Shortcut key to delete a specific expense by ID
-    "delete": "delete",                     # Text command to delete a specific expense
-    "delete specific": "delete",            # Alternate text command to delete a specific expense
-    "delete specific expense": "delete",    # Alternate text command to delete a specific expense
-    "b": "clear",                           # Shortcut key to clear ALL expenses
-    "clear": "clear",                       # Text command to clear ALL expenses
-    "clear all": "clear",                   # Alternate text command to clear ALL expenses
-    "clear all expenses": "clear",          # Alternate text command to clear ALL expenses
-    "c": "back",                            # Shortcut key to go back to main menu
-    "back": "back",                         # Text command to go back
-    "go back": "back",                      # Alternate text command to go back
-}
+INIT_COMMANDS = build_commands({            # Maps user input strings to standardized "main menu" actions
+    "add": ("a", "add", "add expense"),                                             # Shortcut key and text commands for add action
+    "delete": ("b", "delete", "delete expense"),                                    # Shortcut key and text commands for delete action
+    "report": ("c", "report", "report expenses", "see expenses", "view expenses"),  # Shortcut key and text commands for report action
+    "exit": ("d", "exit"),                                                          # Shortcut key and text command for exit action
+})
+
+ADD_COMMANDS = build_commands({             # Maps user input strings to standardized actions in the "Add Expense" submenu
+    "add": ("a", "add", "add expense"),                                             # Shortcut key and text commands to add an expense
+    "back": ("b", "back", "go back"),                                               # Shortcut key and text commands to go back to main menu
+})
+
+DEL_COMMANDS = build_commands({             # Maps user input strings to standardized actions in the "Delete Expense" submenu
+    "delete": ("a", "delete", "delete specific", "delete specific expense"),        # Shortcut key and text commands to delete a specific expense by ID
+    "clear": ("b", "clear", "clear all", "clear all expenses"),                     # Shortcut key and text commands to clear ALL expenses
+    "back": ("c", "back", "go back"),                                               # Shortcut key and text commands to go back to main menu
+})
 
 CATEGORIES = (                              # Tuple of allowed categories (enforced during add)
     "Housing", "Food",                      # Common categories for budgeting/reporting
@@ -61,6 +51,11 @@ CATEGORIES = (                              # Tuple of allowed categories (enfor
     "Debt", "Shopping",                     # Common categories for budgeting/reporting
     "Entertainment")                        # Common categories for budgeting/reporting
 
+_CAT_BY_LOWER = {c.lower(): c for c in CATEGORIES}  # "food" -> "Food": O(1) check that also hands back the one shared category string
+_EMPTY_TOTALS = dict.fromkeys(CATEGORIES, 0.0)  # Template month totals: every category at 0.0, in CATEGORIES order (copy before use)
+
+_AMOUNT_RE = re.compile(r"[-+]?(\d+(\.\d*)?|\.\d+)")  # Plain decimal amounts like 12, 12.50 or .5 (sign allowed so negatives get their own message)
+
 # ===================
 # 3) DATA MODELS
 # ===================
@@ -74,62 +69,95 @@ EXPENSE_MODEL = {                           # Conceptual template of what each e
     "notes": []                             # Placeholder list for future notes feature (currently unused)
 }
 
+@dataclass(slots=True)                      # Slots: no per-record __dict__, so each expense is small and attribute reads are fast
+class Expense:                              # In-memory form of one expense (saved to disk in the EXPENSE_MODEL shape)
+    id: int                                 # Unique integer ID used for delete-by-id and identification
+    name: str                               # Name/label of the expense (e.g., "Groceries", "Rent")
+    amount: float                           # Dollar amount (validated in add_expense)
+    category: str                           # One of the CATEGORIES strings
+    created_on: str                         # ISO date string "YYYY-MM-DD" (saved as "created on")
+    notes: list = field(default_factory=list)   # Placeholder list for future notes feature (currently unused)
+    ym: int = field(init=False, repr=False, compare=False)  # Packed year-month for reports; never saved to disk
+
+    def __post_init__(self):                # Runs after the generated __init__
+        self.ym = year_month(self.created_on)   # Cache the packed year-month once per expense
+
+    @classmethod
+    def from_dict(cls, record):             # Builds an Expense from one saved dict
+        category = record["category"]       # Each loaded category is its own copy of the string
+        return cls(
+            id=record["id"],
+            name=record["name"],
+            amount=record["amount"],
+            category=_CAT_BY_LOWER.get(category.lower(), category),    # Share the one CATEGORIES string instead
+            created_on=record["created on"],
+            notes=record.get("notes", []),
+        )
+
+    def to_dict(self):                      # The dict that gets saved (EXPENSE_MODEL shape, without ym)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "amount": self.amount,
+            "category": self.category,
+            "created on": self.created_on,
+            "notes": self.notes,
+        }
+
+EXPENSE_FILE_MODEL = [                      # Conceptual template of what expenses.jsonl holds, one JSON object per line
+    {"next_id": int},                       # Optional first line written by full rewrites; IDs are never reused after a delete
+    EXPENSE_MODEL,                          # Then one line per expense, oldest first; new expenses are appended to the end
+]
+
 # ===================
 # 4) CORE FUNCTION
 # ===================
 
-def add_expense(tracked_expense):                                                   # Adds a new expense entry to the tracked_expense list
+def add_expense(store):                                                             # Adds a new expense entry to the expense store
     expense_name = input("Please enter the name of the expense: ").strip()          # Prompt user for expense name and strip extra whitespace
 
     while True:                                                                     # Loop until user provides a valid numeric amount
         raw_amount = input("Please enter the amount: ").strip()                     # Read the amount as a string and strip whitespace
-        try:                                                                        # Try to convert the string to a float
-            expense_amount = float(raw_amount)                                      # Convert input to float; may raise ValueError if invalid
-            if expense_amount < 0:                                                  # Reject negative values
-                print("Amounts cannot be negative.")                                # Inform user negative amounts are not allowed
-                continue                                                            # Restart amount prompt loop
-            break                                                                   # Exit loop after valid, non-negative amount is entered
-        except ValueError:                                                          # If float conversion fails (e.g., "abc")
+        if not _AMOUNT_RE.fullmatch(raw_amount):                                    # Cheap pattern check instead of letting float() raise (e.g., "abc")
             print("Please enter a valid number (example: 12.50)")                   # Tell user how to input a valid amount
+            continue                                                                # Restart amount prompt loop
+        expense_amount = float(raw_amount)                                          # Safe to convert now; the pattern only allows plain decimals
+        if expense_amount < 0:                                                      # Reject negative values
+            print("Amounts cannot be negative.")                                    # Inform user negative amounts are not allowed
+            continue                                                                # Restart amount prompt loop
+        break                                                                       # Exit loop after valid, non-negative amount is entered
 
     while True:                                                                     # Loop until user provides a valid category
-        expense_category = input(                                                   # Prompt user for category choice
+        raw_category = input(                                                       # Prompt user for category choice
             "Category Types: Housing, Food, Transportation, Utilities, Healthcare, Savings, Debt, Shopping, or Entertainment "
-        ).strip().title()                                                           # Normalize input by stripping spaces and Title-Casing for matching
+        ).strip().lower()                                                           # Normalize input by stripping spaces and lowercasing for matching
 
-        if expense_category in CATEGORIES:                                          # Check if category is one of the allowed categories
+        expense_category = _CAT_BY_LOWER.get(raw_category)                          # The canonical CATEGORIES string, or None if not allowed
+        if expense_category is not None:                                            # Check if category is one of the allowed categories
             break                                                                   # Exit loop if category is valid
         else:                                                                       # Otherwise, category is invalid
             print("Invalid category. PLease try again.")                            # Ask user to try again
 
-    new_expense = {                                                                 # Build the expense dictionary that will be saved/printed later
-        "id": get_next_id(tracked_expense),                                         # Generate a unique ID based on the current tracked list
-        "name": expense_name,                                                       # Store the user-entered name
-        "amount": expense_amount,                                                   # Store the validated float amount
-        "category": expense_category,                                               # Store the validated category
-        "created on": date.today().isoformat(),                                     # Store today's date as ISO string (YYYY-MM-DD)
-        "notes": []                                                                 # Initialize notes as empty list for future expansion
-    }                                                                               # End of new_expense dict
-
-    tracked_expense.append(new_expense)                                             # Add the new expense to the in-memory list
-    save_to_expense(tracked_expense)                                                # Persist the updated list to expenses.json
-
-def get_next_id(tracked_expense):                                                   # Generates the next unique ID for a new expense
-    if not tracked_expense:                                                         # If list is empty (no expenses yet)
-        return 1                                                                    # Start IDs at 1
-    return max(expense['id'] for expense in tracked_expense) + 1                    # Find current max ID in list and return max+1
-
-def delete_expense(tracked_expense, expense_id):                                    # Deletes one expense by its ID and returns the deleted dict
-    for expense in tracked_expense:                                                 # Loop through each expense dict in the list
-        if expense['id'] == expense_id:                                             # Check if this expense's ID matches the requested ID
-            tracked_expense.remove(expense)                                         # Remove the matching expense from the list
-            save_to_expense(tracked_expense)                                        # Save updated list to JSON so deletion persists
-            return expense                                                          # Return the removed expense dict for confirmation messages
-    return None                                                                     # If no ID matched, return None to signal "not found"
-
-def clear_all_expense(expense):                                                     # Clears ALL expenses from the list
-    expense.clear()                                                                 # Remove every expense dict from the list in memory
-    save_to_expense(expense)                                                        # Save the empty list to JSON to persist the clearing
+    new_expense = Expense(                                                          # Build the expense record that will be saved/printed later
+        id=get_next_id(store),                                                      # Take the next unique ID from the store's counter
+        name=expense_name,                                                          # Store the user-entered name
+        amount=expense_amount,                                                      # Store the validated float amount
+        category=expense_category,                                                  # Store the validated category
+        created_on=date.today().isoformat(),                                        # Store today's date as ISO string (YYYY-MM-DD)
+    )                                                                               # notes starts as an empty list for future expansion
+
+    store.add(new_expense)                                                          # Add the new expense to the store (written on the next flush)
+
+def get_next_id(store):                                                             # Generates the next unique ID for a new expense
+    new_id = store.next_id                                                          # Use the stored counter instead of scanning every expense
+    store.next_id += 1                                                              # Advance the counter for the following expense
+    return new_id                                                                   # Return the ID for this expense
+
+def delete_expense(store, expense_id):                                              # Deletes one expense by its ID and returns the deleted Expense
+    return store.delete(expense_id)                                                 # Remove it from the store; None signals "not found"
+
+def clear_all_expense(store):                                                       # Clears ALL expenses from the store
+    store.clear()                                                                   # Remove every expense from the store (written on the next flush)
     print("All expenses have been cleared.")                                        # Inform user that all expenses are removed
 
 def view_expense(tracked_expense):                                                  # Displays all expenses in a simple list format
@@ -137,51 +165,181 @@ def view_expense(tracked_expense):
         print("You have no expenses saved.")                                        # Inform user there is nothing to view
         return                                                                      # Exit function early
 
-    for expense in tracked_expense:                                                 # Loop through each expense dict
-        print(f"({expense['id']}) ({expense['name']}) - Amount: ({expense['amount']})")  # Print ID, name, and amount for each expense
+    for expense in tracked_expense:                                                 # Loop through each expense record
+        print(f"({expense.id}) ({expense.name}) - Amount: ({expense.amount})")      # Print ID, name, and amount for each expense
 
-def view_monthly_report(tracked_expense):                                           # View Monthly Report function
-    if not tracked_expense:                                                         # If there are no expenses saved at all, stop early
+@lru_cache(maxsize=4096)                                                            # Same-day expenses share one date string, so most calls are cache hits
+def year_month(iso_date):                                                           # Packs a "YYYY-MM-DD" string into one int like 202602
+    return int(iso_date[:4]) * 100 + int(iso_date[5:7])                             # Slice out year and month; no full date parse needed
+
+def view_monthly_report(store):                                                     # View Monthly Report function
+    if not store.expenses:                                                          # If there are no expenses saved at all, stop early
         print("No expenses recorded yet.")
         return
 
     today = date.today()                                                            # Get today's date as a real date object
 
-    current_month = today.month                                                     # Extract the current month and year
-    current_year = today.year
-    
-    category_totals = {category: 0.0 for category in CATEGORIES}                    # Create a dictionary that will hold totals for each category, Every category starts at 0.0
-
-    total_spent = 0.0                                                               # Track total money spent for this month
-
-    for expense in tracked_expense:                                                 # Loop through every saved expense
+    category_totals = store.month_totals(today.year, today.month)                   # Read the precomputed totals; no pass over the history
 
-        expense_date = date.fromisoformat(expense["created on"])                    # Convert the stored ISO string date back into a real date object
-
-        if expense_date.month == current_month and expense_date.year == current_year:   # Only continue if this expense is from the current month AND year
-
-            category = expense["category"]                                          # Grab the category and amount
-            amount = expense["amount"]
-
-            category_totals[category] += amount                                     # Add the amount to the correct category total
-
-            total_spent += amount                                                   # Add to overall monthly total
+    total_spent = sum(category_totals.values())                                     # Monthly total from the handful of category totals, not every expense
 
     print(f"\n=== Expense Report for {today.strftime('%B %Y')} ===")                # Print the report header
 
     print(f"Total spent this month: ${total_spent:.2f}\n")                          # Print the monthly total formatted to 2 decimal places
 
-    for category in CATEGORIES:                                                     # Loop through categories in fixed order and print their totals
-        print(f"{category}: ${category_totals[category]:.2f}")
-
-def save_to_expense(tracked_expense):                                               # Saves the current expenses list to the JSON file
-    with EXPENSE_FILE.open("w", encoding="utf-8") as f:                             # Open expenses.json in write mode (overwrites existing file)
-        json.dump(tracked_expense, f, indent=2)                                     # Dump list of dicts into JSON with indentation for readability
+    for category in CATEGORIES:                                                     # One line per known category, in CATEGORIES order
+        print(f"{category}: ${category_totals[category]:.2f}")                      # (unknown categories from old files only count toward the total)
+
+def expense_line(record):                                                           # Encodes one dict as a single line of the file
+    return json.dumps(record, separators=JSON_SEPARATORS) + "\n"                    # Compact JSON plus the newline that ends the line
+
+def append_expenses(new_expenses):                                                  # Adds new expenses to the end of the file without rewriting it
+    data = "".join(expense_line(e.to_dict()) for e in new_expenses)                 # Encode every new expense into one string
+    with EXPENSE_FILE.open("a", encoding="utf-8") as f:                             # Open in append mode (creates the file if needed)
+        f.write(data)                                                               # One write, however long the history is
+
+def rewrite_expenses(tracked_expense, next_id):                                     # Rewrites the whole file (only needed after deletes/clears)
+    data = expense_line({"next_id": next_id}) + "".join(                            # Counter line first, then every expense
+        expense_line(e.to_dict()) for e in tracked_expense)
+    EXPENSE_TMP_FILE.write_text(data, encoding="utf-8")                             # Write everything to the scratch file in a single write
+    os.replace(EXPENSE_TMP_FILE, EXPENSE_FILE)                                      # Swap it in; a crash mid-save leaves the old file intact
+
+def load_expenses():                                                                # Returns (expense dicts, next_id, needs_rewrite) from disk
+    if EXPENSE_FILE.exists():                                                       # Normal case: read the JSON Lines file
+        expenses = []                                                               # Expense dicts in file order
+        next_id = 1                                                                 # Saved counter, if the file has one
+        torn = False                                                                # True if the last append was cut off mid-write
+        with EXPENSE_FILE.open("r", encoding="utf-8") as f:                         # Open expenses.jsonl in read mode
+            lines = [line for line in f if line.strip()]                            # One JSON object per line (blank lines skipped)
+        for number, line in enumerate(lines, start=1):                              # Decode each line in file order
+            try:
+                record = json.loads(line)                                           # Decode this line
+            except json.JSONDecodeError:                                            # A line that isn't complete JSON
+                if number < len(lines):                                             # Damage before the last line is not a torn append,
+                    raise                                                           # so don't guess; stop with the error
+                torn = True                                                         # The last append was interrupted: drop that line
+                break
+            if "next_id" in record:                                                 # The counter line from the last full rewrite
+                next_id = record["next_id"]
+            else:                                                                   # Any other line is an expense
+                expenses.append(record)
+        highest = max((e['id'] for e in expenses), default=0)                       # Appended expenses may be newer than the counter line
+        return expenses, max(next_id, highest + 1), torn                            # A torn file is rewritten cleanly on the next flush
+
+    if LEGACY_EXPENSE_FILE.exists():                                                # Older single-document expenses.json
+        data = json.loads(LEGACY_EXPENSE_FILE.read_text(encoding="utf-8"))          # Read and decode it in one go
+        if isinstance(data, list):                                                  # Oldest files were a bare list of expenses
+            return data, max((e['id'] for e in data), default=0) + 1, True          # Compute the counter once from the highest ID
+        return data["expenses"], data["next_id"], True                              # {"next_id": ..., "expenses": [...]} layout
+
+    return [], 1, False                                                             # No saved expenses yet; IDs start at 1
+
+class ExpenseStore:                                                                 # Holds the expenses in memory and groups writes into a single save
+    def __init__(self):                                                             # Set up an empty, not-yet-loaded store
+        self._by_id = {}                                                            # In-memory Expense records keyed by ID (keeps insertion order)
+        self._totals_by_ym = {}                                                     # Running totals: packed year-month -> {category: amount}
+        self._by_ym = {}                                                            # The same expenses bucketed by month: packed year-month -> {ID: Expense}
+        self._next_id = 1                                                           # ID the next added expense will get (IDs start at 1)
+        self._pending = []                                                          # Expenses added since the last flush (appended to the file)
+        self._dirty = False                                                         # True when the whole file must be rewritten (delete/clear)
+        self._loaded = False                                                        # The file is only read the first time something needs it
+
+    def __enter__(self):                                                            # Runs at the start of a "with ExpenseStore() as store:" block
+        return self                                                                 # Hand the store to the "as" name; nothing is read yet
+
+    def _load(self):                                                                # Reads the file on first use (later calls do nothing)
+        if self._loaded:                                                            # Already in memory
+            return
+        self._loaded = True
+
+        expenses, self._next_id, self._dirty = load_expenses()                      # Read the file once; older formats get rewritten on the next flush
+
+        for record in expenses:                                                     # Walk the loaded list once
+            expense = Expense.from_dict(record)                                     # Convert each saved dict into an Expense record
+            self._count(expense)                                                    # Add it to its month's bucket and running totals
+            self._by_id[expense.id] = expense                                       # Index it by ID
+
+    def __exit__(self, exc_type, exc_value, traceback):                             # Runs when the "with" block ends (normally or by error)
+        self.flush()                                                                # Write any pending changes one last time
+        return False                                                                # Never swallow exceptions
+
+    @property
+    def expenses(self):                                                             # Read-only view of every expense, oldest first
+        self._load()                                                                # Load on first use
+        return self._by_id.values()                                                 # No copy; iterating and len() work like a list
+
+    @property
+    def next_id(self):                                                              # ID the next added expense will get
+        self._load()                                                                # Load on first use (the counter is saved in the file)
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, value):                                                       # Advanced by get_next_id() after each add
+        self._load()
+        self._next_id = value
+
+    def add(self, expense):                                                         # Adds one Expense record
+        self._load()                                                                # Load on first use
+        self._count(expense)                                                        # Add it to its month's bucket and running totals
+        self._by_id[expense.id] = expense                                           # Store it under its ID
+        self._pending.append(expense)                                               # Queue it to be appended on the next flush
+
+    def delete(self, expense_id):                                                   # Removes one expense by ID and returns it (or None)
+        self._load()                                                                # Load on first use
+        expense = self._by_id.pop(expense_id, None)                                 # Direct lookup by ID; None if no ID matched
+        if expense is not None:                                                     # Only a real removal needs saving
+            self._uncount(expense)                                                  # Take it back out of its month's bucket and totals
+            self._dirty = True                                                      # Mark for saving instead of writing right away
+        return expense                                                              # Return the removed Expense (or None for "not found")
+
+    def clear(self):                                                                # Removes ALL expenses
+        self._load()                                                                # Load first so the saved ID counter is kept
+        self._by_id.clear()                                                         # Empty the in-memory index
+        self._totals_by_ym.clear()                                                  # No expenses means no monthly totals
+        self._by_ym.clear()                                                         # and no month buckets
+        year_month.cache_clear()                                                    # Forget cached date strings along with the expenses
+        self._dirty = True                                                          # Mark for saving instead of writing right away
+
+    def month_totals(self, year, month):                                            # Returns {category: total} for one month (all 0.0 if none)
+        self._load()                                                                # Load on first use
+        totals = self._totals_by_ym.get(year * 100 + month)                         # Look up the month's running totals directly
+        if totals is None:                                                          # Nothing recorded for that month
+            return _EMPTY_TOTALS.copy()                                             # Every category starts at 0.0, in CATEGORIES order
+        return dict(totals)                                                         # Copy so callers can't change the running totals
+
+    def _count(self, expense):                                                      # Adds one expense to its month's bucket and category total
+        totals = self._totals_by_ym.get(expense.ym)                                 # Find that month's category totals
+        if totals is None:                                                          # First expense seen for that month
+            totals = _EMPTY_TOTALS.copy()                                           # Every category starts at 0.0, in CATEGORIES order
+            self._totals_by_ym[expense.ym] = totals                                 # Remember the new month totals
+            self._by_ym[expense.ym] = {}                                            # and the new month bucket
+        totals[expense.category] = totals.get(expense.category, 0.0) + expense.amount   # Update one category total (old files may hold categories no longer in CATEGORIES)
+        self._by_ym[expense.ym][expense.id] = expense                               # File the expense under its month
+
+    def _uncount(self, expense):                                                    # Removes one expense from its month's bucket and category total
+        bucket = self._by_ym[expense.ym]                                            # That month's remaining expenses
+        del bucket[expense.id]                                                      # Take this one out
+        self._totals_by_ym[expense.ym][expense.category] = sum(                     # Re-add what is left in that category instead of subtracting,
+            (e.amount for e in bucket.values() if e.category == expense.category), 0.0)  # so float error can't pile up (or leave a -0.00)
+
+    def flush(self):                                                                # Writes pending changes to disk in one go (nothing if never loaded)
+        if self._dirty:                                                             # A delete or clear happened: rewrite the whole file
+            rewrite_expenses(self._by_id.values(), self._next_id)                   # Also covers anything still pending
+        elif self._pending:                                                         # Only additions: append them, old lines stay untouched
+            append_expenses(self._pending)                                          # One append for every expense added since the last flush
+        self._pending.clear()                                                       # Memory and disk match again
+        self._dirty = False
 
 # ===================
 # 5) UI \ INPUT-OUTPUT LAYER
 # ===================
 
+def dispatch(prompt, table) -> str:                                                 # Reads one choice and maps it to a standardized action string
+    action = table.get(input(prompt).strip().lower(), "")                           # Clean the input and look it up in one step; "" if unknown
+    if not action:                                                                  # If the choice matched no key in the table
+        print("Invalid option, please try again.")                                  # Inform user choice was invalid
+    return action                                                                   # Standardized action, or "" to signal invalid action to the loop
+
 def main_menu() -> None:                                                            # Displays the main menu options (returns nothing)
     print(f"\n{APP_NAME} v{APP_VERSION}")                                           # Print header with app name and version
     print("Please make a choice from the menu: ")                                   # Prompt user to choose an option
@@ -190,32 +348,12 @@ def main_menu() -> None:
     print("C) View Report.")                                                        # Print option C
     print("D) Exit.")                                                               # Print option D
 
-def get_init_choice() -> str:                                                       # Reads the user's main menu choice (returns a string)
-    return input("Choice: ").strip().lower()                                        # Get input, strip whitespace, lowercase for matching dict keys
-
-def get_init_action() -> str:                                                       # Converts raw choice into standardized action string
-    choice = get_init_choice()                                                      # Get the cleaned user choice from get_init_choice()
-    if choice in INIT_COMMANDS:                                                     # If the choice matches a key in INIT_COMMANDS
-        return INIT_COMMANDS[choice]                                                # Return standardized action ("add", "delete", "report", "exit")
-    print("Invalid option, please try again.")                                      # Inform user choice was invalid
-    return ""                                                                       # Return empty string to signal invalid action to the main loop
-
 def add_menu() -> None:                                                             # Displays the "Add Expense" submenu options
     print("\n You are viewing the 'Add Expense' menu")                              # Print submenu header
     print("Please make a choice from the menu: ")                                   # Prompt user to choose an option
     print("A) Add Expense")                                                         # Print add action option
     print("B) Go Back")                                                             # Print back option
 
-def get_add_choice() -> str:                                                        # Reads the user's add submenu choice (returns a string)
-    return input("Choice: ").strip().lower()                                        # Get input, strip whitespace, lowercase for matching dict keys
-
-def get_add_action() -> str:                                                        # Converts raw add submenu choice into standardized action string
-    choice = get_add_choice()                                                       # Get the cleaned user choice from get_add_choice()
-    if choice in ADD_COMMANDS:                                                      # If choice matches a key in ADD_COMMANDS
-        return ADD_COMMANDS[choice]                                                 # Return standardized action ("add" or "back")
-    print("Invalid option, please try again.")                                      # Inform user choice was invalid
-    return ""                                                                       # Return empty string to signal invalid action to submenu loop
-
 def del_menu() -> None:                                                             # Displays the "Delete Expense" submenu options
     print("\n You are viewing the 'Delete Expense' menu")                           # Print submenu header
     print("Please make a choice from the menu: ")                                   # Prompt user to choose an option
@@ -223,31 +361,18 @@ def del_menu() -> None:
     print("B) Clear All Expenses")                                                  # Print clear-all option
     print("C) Go back")                                                             # Print go-back option
 
-def get_del_choice() -> str:                                                        # Reads the user's delete submenu choice (returns a string)
-    return input("Choice: ").strip().lower()                                        # Get input, strip whitespace, lowercase for matching dict keys
-
-def get_del_action() -> str:                                                        # Converts raw delete submenu choice into standardized action string
-    choice = get_del_choice()                                                       # Get the cleaned user choice from get_del_choice()
-    if choice in DEL_COMMANDS:                                                      # If choice matches a key in DEL_COMMANDS
-        return DEL_COMMANDS[choice]                                                 # Return standardized action ("delete", "clear", or "back")
-    print("Invalid option, please try again.")                                      # Inform user choice was invalid
-    return ""                                                                       # Return empty string to signal invalid action to submenu loop
-
 # ===================
 # 6) MAIN PROGRAM LOOP
 # ===================
 
 def main():                                                                         # Main entry point that runs the application loop
-    if not EXPENSE_FILE.exists():                                                   # If expenses.json does not exist yet
-        with EXPENSE_FILE.open("w", encoding="utf-8") as f:                         # Create/open expenses.json in write mode
-            json.dump([], f)                                                        # Initialize file with an empty list so json.load works later
-
-    with EXPENSE_FILE.open("r", encoding="utf-8") as f:                             # Open expenses.json in read mode
-        expense = json.load(f)                                                      # Load JSON list into Python list named 'expense'
+    with ExpenseStore() as store:                                                   # Load expenses once; pending changes are saved when the block ends
+        run_menu(store)                                                             # Run the menus against the loaded store
 
+def run_menu(store):                                                                # Menu loop; every change goes through the store
     while True:                                                                     # Main program loop (runs until user exits)
         main_menu()                                                                 # Display the main menu
-        action = get_init_action()                                                  # Convert user input into standardized action
+        action = dispatch("Choice: ", INIT_COMMANDS)                                # Convert user input into standardized action
 
         if not action:                                                              # If action is empty string (invalid input)
             continue                                                                # Restart loop and show the menu again
@@ -255,31 +380,33 @@ def main():
         elif action == "add":                                                       # If user chose add
             while True:                                                             # Enter the "Add Expense" submenu loop
                 add_menu()                                                          # Display add submenu options
-                action = get_add_action()                                           # Get standardized add submenu action
+                action = dispatch("Choice: ", ADD_COMMANDS)                         # Get standardized add submenu action
 
                 if not action:                                                      # If action is invalid (empty string)
                     continue                                                        # Restart add submenu loop
 
                 if action == "add":                                                 # If user chose to add an expense
-                    add_expense(expense)                                            # Call add_expense with the full expense list
+                    add_expense(store)                                              # Call add_expense with the expense store
 
                 elif action == "back":                                              # If user chose to go back
                     break                                                           # Exit add submenu loop and return to main menu
 
+            store.flush()                                                           # Save everything added in this submenu before returning to main menu
+
         elif action == "delete":                                                    # If user chose delete
             while True:                                                             # Enter the "Delete Expense" submenu loop
                 del_menu()                                                          # Display delete submenu options
-                action = get_del_action()                                           # Get standardized delete submenu action
+                action = dispatch("Choice: ", DEL_COMMANDS)                         # Get standardized delete submenu action
 
                 if not action:                                                      # If action is invalid (empty string)
                     continue                                                        # Restart delete submenu loop
 
                 if action == "delete":                                              # If user chose delete specific expense
-                    if not expense:                                                 # If there are no saved expenses
+                    if not store.expenses:                                          # If there are no saved expenses
                         print("You have no expenses saved.")                        # Inform user nothing can be deleted
                         continue                                                    # Restart delete submenu loop
 
-                    view_expense(expense)                                           # Show expenses so user can see IDs
+                    view_expense(store.expenses)                                    # Show expenses so user can see IDs
 
                     remove_choice = input("Please enter the specific ID to remove: ")  # Prompt user for an expense ID to delete
 
@@ -289,12 +416,12 @@ def main():
                         print("Please enter a valid ID")                            # Inform user input must be numeric
                         continue                                                    # Restart delete submenu loop
 
-                    removed = delete_expense(expense, expense_id)                   # Attempt deletion and store returned dict/None
+                    removed = delete_expense(store, expense_id)                     # Attempt deletion and store returned dict/None
 
                     if removed is None:                                             # If delete_expense returned None (not found)
                         print("No expense found with that ID.")                     # Inform user ID did not match any expense
                     else:                                                           # Otherwise, deletion succeeded
-                        print(f"Removed: {removed['name']}")                        # Confirm which expense was removed by printing its name
+                        print(f"Removed: {removed.name}")                           # Confirm which expense was removed by printing its name
 
                 elif action == "clear":                                             # If user chose clear all expenses
 
@@ -302,7 +429,7 @@ def main():
 
                     if confirm_action == "y":
                         print("All currently tracked expenses have been cleared.")
-                        clear_all_expense(expense)                                      # Clear all expenses and save empty list
+                        clear_all_expense(store)                                        # Clear all expenses (saved on the next flush)
 
                     if confirm_action == "n":
                         break
@@ -310,8 +437,10 @@ def main():
                 elif action == "back":                                              # If user chose go back
                     break                                                           # Exit delete submenu loop and return to main menu
 
+            store.flush()                                                           # Save every deletion from this submenu before returning to main menu
+
         elif action == "report":                                                    # If user chose report
-            view_monthly_report(expense)                                                    # Print report totals (total spent + totals by category)
+            view_monthly_report(store)                                              # Print report totals (total spent + totals by category)
 
         elif action == "exit":                                                      # If user chose exit
             print(f"Thanks for using {APP_NAME} v{APP_VERSION}")                    # Print a friendly exit message with name/version
@@ -3,8 +3,9 @@
 # ===================
 
 import json                                                         # Used to serialize (save) and deserialize (load) habit data to/from a JSON file
-from pathlib import Path                                            # Used to create a file paht object for habits.json
-from datetime import date, timedelta                                # Used to get today's date for habit creation and completion tracking, and timedelta for streak math
+import pickle                                                       # Used in place of json when HABITS_FORMAT is "pickle"
+from datetime import date                                           # Used to get today's date for habit creation and completion tracking
+from menu_app import MenuApp, ask, EXIT                             # Shared menu loop, handler dispatch, file saving and prompt reader
 
 # ===================
 # 2) CONFIG / CONSTANTS
@@ -13,226 +14,266 @@ from datetime import date, timedelta                                # Used to ge
 APP_NAME = "Habit Tracker"                                          # Application name displayed in the menu header
 APP_VERSION = "0.1.0"                                               # Current version of the application
 
-HABITS_FILE = Path("habits.json")                                   # File path object representing the JSON file where habits are stored
-
-COMMANDS = {                                                        # All Menu Commands
-    "1": "add",                                                     # Numeric shortcut to add a new habit
-    "add": "add",                                                   # Text command to add ↑
-
-    "2": "delete",                                                  # Numeric shortcut to delete a habit by ID
-    "delete": "delete",                                             # Text command to delete ↑
-
-    "3": "view",                                                    # Numeric shortcut to view all habits
-    "view": "view",                                                 # Text command to view ↑
-
-    "4": "clear",                                                   # Numeric shortcut to clear all habits
-    "clear": "clear",                                               # Text command to clear ↑
-
-    "5": "mark",                                                    # Numeric shortcut to mark a habit complete for today
-    "mark": "mark",                                                 # Text command to mark ↑
-    "mark complete": "mark",                                        # Alternate text command to mark ↑↑
-
-    "6": "exit",                                                    # Numeric shortcut to exit the application
-    "exit": "exit",                                                 # Text command to exit ↑
-}
+HABITS_FORMAT = "json"                                              # "json" (readable, default) or "pickle" (faster binary; Python-only, only load files you trust)
+HABITS_JSON_FILE = "habits.json"                                    # File where habits are stored as JSON (kept up to date as an export while HABITS_FORMAT is "pickle")
+HABITS_PICKLE_FILE = "habits.pickle"                                # File where habits are stored when HABITS_FORMAT is "pickle"
 
 # ===================
 # 3) DATA MODELS
 # ===================
 
-HABIT_MODEL = {                                                     # Conceptual Template of expected structure of each habit dict
+HABIT_MODEL = {                                                     # Conceptual Template of expected structure of each saved habit dict
     "id": int,                                                      # Unique integer indentifier for each habit
     "name": str,                                                    # Name of the habit entered by the user
     "created on": "YYYY-MM-DD",                                     # ISO-formatted date string of when the habit was created
     "completed_dates": []                                           # List of ISO-formatted date strings when the habit was completed
-}
+}                                                                   # In memory each habit is a Habit object (below)
 
-# ===================
-# 4) CORE FUNCTIONS
-# ===================
+class Habit:                                                        # One tracked habit while the program runs
+    __slots__ = ("id", "name", "created_on", "completed_dates", "_ord_set", "_streak")  # Fixed fields, no per-object dict (smaller, faster attribute reads)
 
-def add_habit(tracked_habit):                                       # Add new habit function
-    habit_name = input("Please enter the habit's name: ").strip()   # Ask the user for the habit name ane remove extra whitespace
+    def __init__(self, habit_id, name, created_on, completed_dates=None):
+        self.id = habit_id                                          # Unique integer indentifier for the habit
+        self.name = name                                            # Name of the habit entered by the user
+        self.created_on = created_on                                # ISO-formatted date string of when the habit was created
+        self.completed_dates = completed_dates if completed_dates is not None else []   # ISO-formatted date strings when the habit was completed
+        self._ord_set = {date.fromisoformat(d).toordinal() for d in self.completed_dates}  # Same history as day numbers, parsed once (never saved)
+        self._streak = None                                         # Last counted streak as (number of completed dates, today, streak), or None (never saved)
 
-    new_habit = {                                                   # Create a new habit dict with a unique ID and today's creation date
-        "id": get_next_id(tracked_habit),                           # Generate the next available unique ID
-        "name": habit_name,                                         # Store the user-provided habit name
-        "created on": date.today().isoformat(),                     # Store today's date as ISO string
-        "completed_dates": []                                       # Start with no completion history
-    }
+    @classmethod
+    def from_dict(cls, data):                                       # Build a Habit from one saved habit dict (see HABIT_MODEL)
+        return cls(data["id"], data["name"], data["created on"], data["completed_dates"])
 
-    tracked_habit.append(new_habit)                                 # Add the new habit dict to the list of tracked habits
-    save_habits(tracked_habit)                                      # Persist the updated habit list to the JSON file
+    def to_dict(self):                                              # Turn the Habit back into a saved habit dict
+        return {
+            "id": self.id,
+            "name": self.name,
+            "created on": self.created_on,
+            "completed_dates": self.completed_dates,
+        }
 
-def get_next_id(tracked_habits) -> int:                             # Get new ID function
-    if not tracked_habits:                                          # If there are no habits yet,
-        return 1                                                    # start IDs at 1.
-    return max(habit['id'] for habit in tracked_habits) + 1         # Find the highest existing habit ID and return one higher
+next_habit_id = 1                                                   # ID the next added habit will get
+
+# ===================
+# 4) CORE FUNCTIONS
+# ===================
 
-def view_habits(tracked_habits):                                    # New habits function
-    if not tracked_habits:                                          # If the list is empty,
+def add_habit(tracked_habit, save):                                 # Add new habit function (tracked_habit is the {id: habit} dict, save marks it changed)
+    habit_name = ask("Please enter the habit's name: ").strip()     # Ask the user for the habit name ane remove extra whitespace
+
+    new_habit = Habit(                                              # Create a new Habit with a unique ID and today's creation date
+        get_next_id(),                                              # Generate the next available unique ID
+        habit_name,                                                 # Store the user-provided habit name
+        date.today().isoformat(),                                   # Store today's date as ISO string
+    )                                                               # (starts with no completion history)
+
+    tracked_habit[new_habit.id] = new_habit                         # Add the new habit to the tracked habits under its ID
+    save()                                                          # Persist the updated habits to the file
+
+def index_habits(loaded_habits):                                    # Turns the loaded list into the {id: habit} dict used everywhere else
+    habits_by_id = {}                                               # Habits keyed by ID (keeps the saved order)
+    for data in loaded_habits:                                      # Walk the loaded habit dicts once
+        habit = Habit.from_dict(data)                               # Turn each into a Habit (parses its dates once)
+        habits_by_id[habit.id] = habit                              # One entry per habit, keyed by its ID
+    return habits_by_id                                             # The tracked habits from now on
+
+def start_next_id(tracked_habits):                                  # Sets up the ID counter once the habits are loaded
+    global next_habit_id                                            # Rebinds the module-level counter
+    next_habit_id = max(tracked_habits, default=0) + 1              # One past the highest existing ID (1 if there are none)
+
+def get_next_id() -> int:                                           # Get new ID function
+    global next_habit_id                                            # Rebinds the module-level counter
+    new_id = next_habit_id                                          # Take the counter instead of scanning every habit
+    next_habit_id += 1                                              # Advance it for the following habit
+    return new_id                                                   # Return the ID for this habit
+
+def view_habits(tracked_habits):                                    # View habits function; returns the {id: habit} map it listed
+    if not tracked_habits:                                          # If there are no habits,
         print("You are not currently tracking any habits.")         # inform the user,
-        return                                                      # then exit the function.
-
-    for habit in tracked_habits:                                    # Loop through each habit dict in the list
-        streak = get_streak(habit)                                  # Calls get_streak() math function
-        print(f"({habit['id']}) {habit['name']} - Streak: {streak}")    # Display the habit's ID, name, and completion streak
-
-def delete_habit(tracked_habits, habit_id):                         # Delete specific habit function
-    for habit in tracked_habits:                                    # Loop through each habit dict in the list
-        if habit["id"] == habit_id:                                 # If this habit's stored ID matches the user's ID input
-            tracked_habits.remove(habit)                            # Remove the habit from the list
-            save_habits(tracked_habits)                             # Persist the updated list to JSON
-            return habit                                            # Return the removed habit dict
-    return None                                                     # If no matching ID was found, return None
-
-def clear_habits(habits):                                           # Clear entire habits list function
-    habits.clear()                                                  # Removes ALL habits dicts from the list
-    save_habits(habits)                                             # Persist the now-empty list to JSON
+        return tracked_habits                                       # then exit the function (the map is empty).
+
+    today = date.today()                                            # Read the clock once for the whole list
+    for habit in tracked_habits.values():                           # Loop through each habit
+        streak = get_streak(habit, today)                           # Calls get_streak() math function
+        print(f"({habit.id}) {habit.name} - Streak: {streak}")      # Display the habit's ID, name, and completion streak
+
+    return tracked_habits                                           # Callers pick the habit by ID from the same map, no second scan
+
+def delete_habit(tracked_habits, habit_id, save):                   # Delete specific habit function
+    habit = tracked_habits.pop(habit_id, None)                      # Remove the habit by ID directly (None if there is no match)
+    if habit is not None:                                           # If a habit with that ID existed
+        save()                                                      # Persist the updated habits to the file
+    return habit                                                    # Return the removed Habit, or None if no matching ID was found
+
+def clear_habits(habits, save):                                     # Clear all habits function
+    global next_habit_id                                            # Rebinds the module-level counter
+    habits.clear()                                                  # Removes ALL habits
+    next_habit_id = 1                                               # Restart IDs at 1
+    save()                                                          # Persist the now-empty list to the file
     print("Your current habits have been cleared.")                 # Inform the users that ALL habits have been cleared.
 
-def save_habits(tracked_habits):                                    # Save habits to JSON function
-    with HABITS_FILE.open("w", encoding="utf-8") as f:              # Open the JSON file in write mode (this overwrites existing content)
-        json.dump(tracked_habits, f, indent=2)                      # Serialize the list of habit dicts to JSON with readable formatting
+def encode_json_habits(tracked_habits):                             # Turn the {id: habit} dict into JSON bytes
+    saved = [habit.to_dict() for habit in tracked_habits.values()]  # Saved as a list of habit dicts (without "_ord_set")
+    return json.dumps(saved, indent=2).encode("utf-8")              # with readable formatting
 
-def mark_complete(tracked_habits, habit_id):                       # Mark daily completion function
-    for habit in tracked_habits:                                    # Loops through each habit dict in the list
-        if habit['id'] == habit_id:                                # Check if THIS habit's stored id matches the id the User asked for
-            today_str = date.today().isoformat()                    # Get today's date as a JSON-safe string like "2026-02-25"
+def decode_json_habits(raw):                                        # Turn JSON bytes back into the {id: habit} dict
+    return index_habits(json.loads(raw))                            # json.loads accepts UTF-8 bytes directly
 
-            if today_str not in habit['completed_dates']:           # If today is NOT already recorded, add it
-                habit['completed_dates'].append(today_str)          # Store the date string
-                save_habits(tracked_habits)                         # persist the updated list to JSON
-                return True                                         # Signal success
-            
-            return False                                            # If today is already recorded, don't add a duplicate
-        
-    return None                                                     # If we finish the loop without finding the id, the habit doesn't exist
+def encode_pickle_habits(tracked_habits):                           # Turn the {id: habit} dict into pickle bytes
+    saved = [habit.to_dict() for habit in tracked_habits.values()]  # Same list of habit dicts as the JSON file
+    return pickle.dumps(saved, protocol=5)                          # encoded in C with no text formatting
 
-def get_streak(habit):                                              # Streak math function
-    completed_set = {date.fromisoformat(d) for d in habit["completed_dates"]}   # Convert stored date strings to date objects for comparison
+def decode_pickle_habits(raw):                                      # Turn pickle bytes back into the {id: habit} dict
+    return index_habits(pickle.loads(raw))                          # decoded in one call
 
-    streak = 0                                                      # Initialize streak counter at 0
-    current_day = date.today()                                      # Start counting from today
+def mark_complete(tracked_habits, habit_id, today, save):           # Mark daily completion function (today is passed in by the caller)
+    habit = tracked_habits.get(habit_id)                            # Look the habit up by ID directly
+    if habit is None:                                               # If no habit has that id,
+        return None                                                 # the habit doesn't exist
 
-    while current_day in completed_set:                             # While today's date (or pervious days) exist in the completion history, continue counting backward
-        streak += 1                                                 # Increase streak count by 1 for each consecutive day found
-        current_day -= timedelta(days=1)                            # Move one day backward
+    today_ord = today.toordinal()                                   # Today as a day number for the set lookup
 
-    return streak                                                   # Return total number of consecutive days completed up to today
-# ===================
-# 5) UI / INPUT-OUTPUT LAYER
-# ===================
+    if today_ord not in habit._ord_set:                             # If today is NOT already recorded (set lookup, not a list scan), add it
+        habit.completed_dates.append(today.isoformat())             # Store the date as a JSON-safe string like "2026-02-25"
+        habit._ord_set.add(today_ord)                               # and its day number for streak math
+        save()                                                      # persist the updated habits to the file
+        return True                                                 # Signal success
 
-def show_menu() -> None:                                            # Show main menu function, does not return any value
-    print(f"\n{APP_NAME} v{APP_VERSION}")                           # Display the application name and version at the top of the menu
+    return False                                                    # If today is already recorded, don't add a duplicate
 
-    print("Please make a choice from the menu: ")                   # Prompt the user to choose an option
+def get_streak(habit, today):                                       # Streak lookup function (cached); streaks are counted back from today
+    count = len(habit.completed_dates)                              # Changes when the habit is marked
+    cached = habit._streak                                          # The habit's own cached streak (goes away with the habit)
+    if cached is not None and cached[0] == count and cached[1] == today:   # Nothing changed since it was counted (same history, same day),
+        return cached[2]                                            # so reuse it.
+    streak = count_streak(habit, today)                             # Otherwise do the real count,
+    habit._streak = (count, today, streak)                          # and remember it (replaces the old entry) for the next view.
+    return streak                                                   # Return total number of consecutive days completed up to today
 
-    print("1) Add.")                                                # Menu Options ↓↓↓↓↓↓
-    print("2) Delete.")
-    print("3) View.")
-    print("4) Clear.")
-    print("5) Mark Complete")
-    print("6) Exit.")                                               # Menu Options ↑↑↑↑↑↑
+def count_streak(habit, today):                                     # Streak math function
+    completed = habit._ord_set                                      # Completion days as day numbers, parsed once at load time
 
+    streak = 0                                                      # Initialize streak counter at 0
+    current_day = today.toordinal()                                 # Start counting from today
 
-def get_menu_choice() -> str:                                       # Prompts the user for input, returns a string
-    return input("Choice: ").strip().lower()                        # Removes extra space, and ensure consistent comparison (e.g., "Add" and "add" match)
+    while current_day in completed:                                 # While today's date (or pervious days) exist in the completion history, continue counting backward
+        streak += 1                                                 # Increase streak count by 1 for each consecutive day found
+        current_day -= 1                                            # Move one day backward
 
+    return streak                                                   # Return total number of consecutive days completed up to today
 
-def get_action() -> str:                                            # Gets cleared action and matches to command, returns a string
-    choice = get_menu_choice()                                      # Gets cleaned input from get_menu_choice()
-    if choice in COMMANDS:                                          # If the input exists in the COMMANDS dict,
-        return COMMANDS[choice]                                     # returns the standardized action string.
-    print("Invalid option, please try again.")                      # If input is not recognized, informs the users
-    return ""                                                       # Return empty string to signal invalid action to main loop
+# ===================
+# 5) UI / INPUT-OUTPUT LAYER
+# ===================
 
+MENU = [                                                            # Menu Options (the app adds the name/version header and prints it with one write)
+    "1) Add.",
+    "2) Delete.",
+    "3) View.",
+    "4) Clear.",
+    "5) Mark Complete",
+    "6) Exit.",
+]
 
 # ===================
 # 6) MAIN PROGRAM LOOP
 # ===================
 
-def main():
+def handle_add(habits, save):                                       # Add Habit Action (every action gets the habits and the app's save function)
+    add_habit(habits, save)                                         # Call add_habit and pass in the habits dict
+
+def handle_delete(habits, save):                                    # Delete Specific Habit Action
+    shown = view_habits(habits)                                     # Display all current habits (with IDs), keeping the ID map it listed
+    if not shown:                                                   # If there are no habits (view_habits already said so),
+        return                                                      # go back to the menu without asking for an ID
 
-    if not HABITS_FILE.exists():                                    # If the habits.json file does not exist yet,
-        with HABITS_FILE.open("w", encoding="utf-8") as f:          # create it,
-            json.dump([], f)                                        # and initialize it with an empty list
+    remove_choice = ask("Enter the habit ID to remove: ").strip()   # Ask the user which habit ID to remove
 
-    with HABITS_FILE.open("r", encoding="utf-8") as f:              # Open the habits.json file in read mode
-        habits = json.load(f)                                       # Load the JSON data into the 'habits' list
+    try:                                                            # Try line
+        habit_id = int(remove_choice)                               # attempt to convert the int to an integer
 
-    while True:                                                     # Main Application Loop (runs until users choses Exit)
-        show_menu()                                                 # Display the main menu options
-        action = get_action()                                       # Converts user input into a standardized action string
+    except ValueError:                                              # Except Line
+        print("Please enter a valid ID.")                           # if conversion fails (not a number), show error,
+        return                                                      # and go back to the menu
 
-        if not action:                                              # If the input was invalid (empty string returned)
-            continue                                                # restart loop and show main menu again
+    removed = delete_habit(shown, habit_id, save)                   # Attempt to delete the habit using the ID
 
-        elif action == "add":                                       # Add Habit Action
-            add_habit(habits)                                       # Call add_habit and pass in the habits list
+    if removed is None:                                             # if delete_habit returned None,
+        print("No habit found with that ID.")                       # inform user that no matching ID was found
 
-        elif action == "delete":                                    # Delete Specific Habit Action 
-            if not habits:                                          # If there are no habits,
-                print("You have no added habits.")                  # inform user, 
-                continue                                            # and restart loop
+    else:                                                           # Otherwise,
+        print(f"Removed: {removed.name}")                           # confirm which habit was removed
 
-            view_habits(habits)                                     # Display all current habits (with IDs)
+def handle_view(habits, save):                                      # View All Habits Action
+    view_habits(habits)                                             # Display all currently tracked habits
 
-            remove_choice = input("Enter the habit ID to remove: ").strip()     # Ask the user which habit ID to remove
+def handle_clear(habits, save):                                     # Clear All Habits Action
+    clear_confirm = ask(
+        "Are you sure you want to clear ALL current habits? You can't undo this action! Y/N: "
+    ).strip().lower()                                               # Asks for confirmation before clearing all habits
 
-            try:                                                    # Try line
-                habit_id = int(remove_choice)                       # attempt to convert the int to an integer
+    if clear_confirm == "y":                                        # Only clear if user confirms with 'y'
+        clear_habits(habits, save)                                  # Calls clear_habits function
 
-            except ValueError:                                      # Except Line
-                print("Please enter a valid ID.")                   # if conversion fails (not a number), show error, 
-                continue                                            # and restart loop
+def handle_mark(habits, save):                                      # Daily Mark Complete Action
+    shown = view_habits(habits)                                     # Calls the view_habits function, keeping the ID map it listed
+    if not shown:                                                   # If there are no habits (view_habits already said so),
+        return                                                      # go back to the menu without asking for an ID
 
-            removed = delete_habit(habits, habit_id)                # Attempt to delete the habit using the ID
+    mark_choice = ask("Please enter the habit's ID: ").strip()      # Asks the user which habit ID they want to mark as complete, stripping whitespace
+    try:                                                            # Try line
+        habit_id = int(mark_choice)                                 # Attempts to conver input string to integer
+    except ValueError:                                              # Except line
+        print("Please enter a valid ID.")                           # if conversion fails (user entered text instead of a number), inform user,
+        return                                                      # and go back to the menu
 
-            if removed is None:                                     # if delete_habit returned None,
-                print("No habit found with that ID.")               # inform user that no matching ID was found
+    result = mark_complete(shown, habit_id, date.today(), save)     # Calls mark_complete() and pass in the listed habits, specific habit ID to mark, and today's date
+    if result is True:                                              # if returned True,
+        print("Marked completed for today.")                        # print confirmation of marking
+    elif result is False:                                           # if returned False,
+        print("Already marked completed today.")                    # print confirmation of previous marking
+    else:                                                           # if returned None,
+        print("No habit found with that ID.")                       # print confirmation that no habit was found under ID the user input
 
-            else:                                                   # Otherwise,
-                print(f"Removed: {removed['name']}")                # confirm which habit was removed
+def handle_exit(habits, save):                                      # Exit Application Action
+    return EXIT                                                     # Tells the app to save, say goodbye and stop
 
-        elif action == "view":                                      # View All Habits Action
-            view_habits(habits)                                     # Display all currently tracked habits
+HANDLERS = {                                                        # All Menu Commands, mapped straight to the function that runs them
+    "1": handle_add,                                                # Numeric shortcut to add a new habit
+    "add": handle_add,                                              # Text command to add ↑
 
-        elif action == "clear":                                     # Clear All Habits Action
-            clear_confirm = input(                                  
-                "Are you sure you want to clear ALL current habits? You can't undo this action! Y/N: "
-            ).strip().lower()                                       # Asks for confirmation before clearing all habits
+    "2": handle_delete,                                             # Numeric shortcut to delete a habit by ID
+    "delete": handle_delete,                                        # Text command to delete ↑
 
-            if clear_confirm == "y":                                # Only clear if user confirms with 'y'
-                clear_habits(habits)                                # Calls clear_habits function
+    "3": handle_view,                                               # Numeric shortcut to view all habits
+    "view": handle_view,                                            # Text command to view ↑
 
-        elif action == "mark":                                      # Daily Mark Complete Action
-            if not habits:                                          # If there are no habits in the list,
-                print("You have no habits to mark")                 # inform the user,
-                continue                                            # and restart the loop
-            
-            view_habits(habits)                                     # Calls the view_habits function
+    "4": handle_clear,                                              # Numeric shortcut to clear all habits
+    "clear": handle_clear,                                          # Text command to clear ↑
 
-            mark_choice = input("Please enter the habit's ID: ").strip()    # Asks the user which habit ID they want to mark as complete, stripping whitespace
-            try:                                                    # Try line
-                habit_id = int(mark_choice)                         # Attempts to conver input string to integer
-            except ValueError:                                      # Except line
-                print("Please enter a valid ID.")                   # if conversion fails (user entered text instead of a number), inform user,
-                continue                                            # and restart the loop
+    "5": handle_mark,                                               # Numeric shortcut to mark a habit complete for today
+    "mark": handle_mark,                                            # Text command to mark ↑
+    "mark complete": handle_mark,                                   # Alternate text command to mark ↑↑
 
-            result = mark_complete(habits, habit_id)                # Calls mark_complete() and pass in full habits list and specific habit ID to mark
-            if result is True:                                      # if returned True,
-                print("Marked completed for today.")                # print confirmation of marking
-            elif result is False:                                   # if returned False,
-                print("Already marked completed today.")            # print confirmation of previous marking
-            else:                                                   # if returned None,
-                print("No habit found with that ID.")               # print confirmation that no habit was found under ID the user input
+    "6": handle_exit,                                               # Numeric shortcut to exit the application
+    "exit": handle_exit,                                            # Text command to exit ↑
+}
+
+HABIT_FORMATS = {                                                   # Every save format: name -> (file, encoder, decoder)
+    "json": (HABITS_JSON_FILE, encode_json_habits, decode_json_habits),
+    "pickle": (HABITS_PICKLE_FILE, encode_pickle_habits, decode_pickle_habits),
+}
 
+app = MenuApp(                                                      # The app that runs the menu loop and saves the habits
+    APP_NAME, APP_VERSION, HANDLERS, MENU,
+    HABIT_FORMATS, HABITS_FORMAT,                                   # Loads whichever file was saved last, saves in HABITS_FORMAT
+    empty=dict,                                                     # No file yet: start with no habits
+)
 
-        elif action == "exit":                                      # Exit Application Action
-            print(f"Thank you for using {APP_NAME} v{APP_VERSION}") # Prints exit message including app name and version
-            break                                                   # Breaks out of the infinite loop to end the program
+def main():
+    habits = app.load()                                             # Load the habits from whichever file was saved last
+    start_next_id(habits)                                           # New habits get IDs after the loaded ones
+    app.run()                                                       # Show the menu until the user choses Exit
 
 
 # ===================
@@ -3,30 +3,20 @@
 # ===================
 
 import json
-from pathlib import Path
+import marshal
+from menu_app import MenuApp, ask, EXIT
 
 # ===================
 # 2) CONFIG / CONSTANTS
 # ===================
 
-TASKS_FILE = Path("tasks.json")
+TASKS_FORMAT = "json" # "json" (readable, default) or "marshal" (faster binary, tied to the Python version)
+TASKS_JSON_FILE = "tasks.json" # kept up to date as an export while TASKS_FORMAT is "marshal"
+TASKS_MARSHAL_FILE = "tasks.marshal"
 
 APP_NAME = "To-Do List Application"
 APP_VERSION = "0.1.0"
 
-COMMANDS = {
-    "a": "add",
-    "add": "add",
-    "b": "remove",
-    "remove": "remove",
-    "c": "view",
-    "view": "view",
-    "d": "clear",
-    "clear": "clear",
-    "e": "exit",
-    "exit": "exit",
-}
-
 # ===================
 # 3) DATA MODELS
 # ===================
@@ -37,124 +27,108 @@ COMMANDS = {
 # 4) CORE FUNCTION
 # ===================
 
-def add_task(tasks): # Add Task to To-Do list function
-    new_task = input("Please enter new task: ").strip()
+def add_task(tasks, save): # Add Task to To-Do list function (save marks the list changed)
+    new_task = ask("Please enter new task: ").strip()
     if not new_task:
         print("No new task added, please try again.")
     else:
         tasks.append(new_task)
-        save_tasks(tasks)
+        save()
         print(f"{new_task} has been added to your To-Do List.")
 
-def remove_task(tasks, index):  # Remove Specific Task from To-Do list function
+def remove_task(tasks, index, save):  # Remove Specific Task from To-Do list function
     removed = tasks.pop(index)
-    save_tasks(tasks)
+    save()
     return removed
 
-def view_tasks(tasks):   # View To-Do list function
+def view_tasks(tasks):   # View To-Do list function; returns the list it showed
     if not tasks:
         print("Your To-Do list is empty")
     else:
         for i, task in enumerate(tasks, start=1):
             print(f"{i}) {task}")
+    return tasks
 
-def clear_list(tasks):  # Clear entire To-Do list function
+def clear_list(tasks, save):  # Clear entire To-Do list function
     tasks.clear()
-    save_tasks(tasks)
+    save()
     print("Your To-Do list has been cleared.")
 
-def save_tasks(tasks): # Save tasks to json file for persistent loading
-    with TASKS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(tasks, f)
+def encode_json_tasks(tasks): # list of task strings -> JSON bytes
+    return json.dumps(tasks).encode("utf-8")
 
 # ===================
 # 5) UI \ INPUT-OUTPUT LAYER
 # ===================
 
-def show_menu() -> None: # prints the main menu
-    print(f"\n{APP_NAME} v{APP_VERSION}")
-    print("Please make a choice from the menu: ")
-    print("A) Add.")
-    print("B) Remove.")
-    print("C) View.")
-    print("D) Clear.")
-    print("E) Exit.")
-
-def get_menu_choice() -> str: # collects and cleans input
-    return input("Choice: ").strip().lower()
-
-def get_action() -> str: # turns raw input into an action
-    choice = get_menu_choice()
-    if choice in COMMANDS:
-        return COMMANDS[choice]
-    print("Invalid option, please try again.")
-    return ""
+MENU = [
+    "A) Add.",
+    "B) Remove.",
+    "C) View.",
+    "D) Clear.",
+    "E) Exit.",
+]
 
 # ===================
 # 6) MAIN PROGRAM LOOP
 # ===================
-def main():
-
-    if not TASKS_FILE.exists(): # Ensure file exists on first start and future loads
-        with TASKS_FILE.open("w", encoding="utf-8") as f:
-            json.dump([], f)
-
-    with TASKS_FILE.open("r", encoding="utf-8") as f:
-        task_file = json.load(f)
-
-        tasks = task_file
 
-    while True:  
-        show_menu()
+def handle_view(tasks, save): # every action gets the tasks and the app's save function
+    view_tasks(tasks)
 
-        action = get_action()
+def handle_remove(tasks, save):
+    if not view_tasks(tasks): # empty list: view_tasks already said so
+        return
 
-        if not action:
-            continue
+    remove_choice = ask("Which number would you like removed?").strip()
 
-        elif action == "add":
-            add_task(tasks)
+    try:
+        selected_choice = int(remove_choice)
+        index = selected_choice - 1
 
-        elif action == "remove":
-            if not tasks:
-                print("Your To-Do list is empty")
-                continue
+        if 0 <= index < len(tasks):
+            removed = remove_task(tasks, index, save)
+            print(f"'{removed}' has been removed.")
+        else:
+            print("Invalid number. Please try again.")
 
-            view_tasks(tasks)
+    except ValueError:
+        print("Please enter a valid number")
 
-            remove_choice = input("Which number would you like removed?").strip()
+def handle_clear(tasks, save):
+    clear_confirm = ask("Are you sure you want to clear the To-Do list? You can't undo this action! Y/N: ").strip().lower()
 
-            try:
-                selected_choice = int(remove_choice)
-                index = selected_choice - 1
+    if clear_confirm == "y":
+        clear_list(tasks, save)
 
-                if 0 <= index < len(tasks):
-                    removed = remove_task(tasks, index)
-                    print(f"'{removed}' has been removed.")
-                else:
-                    print("Invalid number. Please try again.")
+def handle_exit(tasks, save):
+    return EXIT
 
-            except ValueError:
-                print("Please enter a valid number")
-
-        elif action == "view":
-            view_tasks(tasks)
-
-        elif action == "clear":
-            clear_confirm = input("Are you sure you want to clear the To-Do list? You can't undo this action! Y/N: ").strip().lower()
+HANDLERS = { # menu input -> function that runs it
+    "a": add_task,
+    "add": add_task,
+    "b": handle_remove,
+    "remove": handle_remove,
+    "c": handle_view,
+    "view": handle_view,
+    "d": handle_clear,
+    "clear": handle_clear,
+    "e": handle_exit,
+    "exit": handle_exit,
+}
 
-            if clear_confirm == "y":
-                clear_list(tasks)
+TASK_FORMATS = { # format -> (file, encoder, decoder)
+    "json": (TASKS_JSON_FILE, encode_json_tasks, json.loads),
+    "marshal": (TASKS_MARSHAL_FILE, marshal.dumps, marshal.loads),
+}
 
-            else:
-                continue
+app = MenuApp(APP_NAME, APP_VERSION, HANDLERS, MENU, TASK_FORMATS, TASKS_FORMAT) # loads whichever file was saved last
 
-        elif action == "exit":
-            print(f"Thank you for using {APP_NAME} v{APP_VERSION}")
-            break
+def main():
+    app.run()
 
 # ===================
 # 7) Run Guard
 # ===================
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,135 @@
+# ===================
+# 1) Imports
+# ===================
+
+import os
+import time
+import atexit
+import sys
+from pathlib import Path
+
+# ===================
+# 2) CONFIG / CONSTANTS
+# ===================
+
+SAVE_INTERVAL = 5.0 # seconds between checkpoint saves while there are unsaved changes
+EXIT = "exit" # handlers return this exact object to stop the app (checked with "is")
+EXPORT_FORMAT = "json" # while another save format is active, a copy in this format is written on every flush
+
+# ===================
+# 3) INPUT
+# ===================
+
+def ask(prompt): # like input(), but reads stdin directly (no readline hooks)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line: # end of input; input() raises here too
+        raise EOFError
+    return line.rstrip("\n")
+
+# ===================
+# 4) FILES
+# ===================
+
+def write_file(file, raw): # replace file with raw bytes in one write
+    tmp_file = Path(f"{file}.tmp") # saves go here first, then replace the file
+    tmp_file.write_bytes(raw)
+    os.replace(tmp_file, file) # atomic swap, so a crash mid-save can't corrupt the file
+
+# ===================
+# 5) MENU APP
+# ===================
+
+class MenuApp: # the menu loop, handler dispatch and file saving shared by the CLI apps
+    def __init__(self, name, version, handlers, menu, formats, save_format, empty=list):
+        self.name = name
+        self.version = version
+        self.handlers = handlers # menu input -> function(data, save); a handler calls save() after changing data and returns EXIT to stop the app
+        self.formats = formats # format name -> (file, encode: app data -> bytes, decode: bytes -> app data)
+        self.save_format = save_format # the format (and so the file) changes are saved in
+        self.empty = empty # makes the app data when there is no file yet
+        self.menu_text = ( # built once, printed with a single write
+            f"\n{name} v{version}\n"
+            "Please make a choice from the menu: \n"
+            + "".join(f"{line}\n" for line in menu)
+        )
+        self.data = None
+        self._unsaved = False
+        self._last_save = time.monotonic()
+
+    def load(self): # read the most recently saved file (only the first call reads it)
+        if self.data is not None: # already loaded
+            return self.data
+
+        newest = self._newest_format()
+        if newest is None: # first start: the first save creates the file
+            self.data = self.empty()
+            return self.data
+
+        file, _, decode = self.formats[newest]
+        self.data = decode(Path(file).read_bytes())
+        if newest != self.save_format: # saved in another format last (e.g. before a format switch),
+            self._unsaved = True # so convert it on the next flush
+        return self.data
+
+    def _newest_format(self): # the format whose file was written last (None if there are no files)
+        order = [self.save_format] + [f for f in self.formats if f != self.save_format]
+        newest, newest_time = None, None
+        for fmt in order: # save_format comes first, so it wins ties
+            try:
+                mtime = os.stat(self.formats[fmt][0]).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if newest is None or mtime > newest_time:
+                newest, newest_time = fmt, mtime
+        return newest
+
+    def save(self): # mark the data as changed; flush() does the write
+        self._unsaved = True
+
+    def flush(self): # write unsaved changes to the file
+        if not self._unsaved:
+            return
+
+        if self.save_format != EXPORT_FORMAT and EXPORT_FORMAT in self.formats: # binary save format: keep the JSON copy current too
+            file, encode, _ = self.formats[EXPORT_FORMAT]
+            write_file(file, encode(self.data)) # portable copy first, so the real file stays the newest
+        file, encode, _ = self.formats[self.save_format]
+        write_file(file, encode(self.data))
+
+        self._unsaved = False
+        self._last_save = time.monotonic()
+
+    def checkpoint(self): # save pending changes once they are SAVE_INTERVAL old
+        if self._unsaved and time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            self.flush()
+
+    def show_menu(self):
+        sys.stdout.write(self.menu_text)
+
+    def get_handler(self): # turns raw input into a handler (None if not recognized)
+        choice = ask("Choice: ")
+        handler = self.handlers.get(choice) # fast path: input like "1" needs no cleaning
+        if handler is None:
+            handler = self.handlers.get(choice.strip().lower())
+        return handler
+
+    def run(self):
+        data = self.load()
+        atexit.register(self.flush) # still save if the program ends another way (e.g., Ctrl-C)
+
+        while True:
+            self.checkpoint()
+            self.show_menu()
+            handler = self.get_handler()
+
+            if handler is None:
+                print("Invalid option, please try again.")
+                continue
+
+            if handler(data, self.save) is EXIT:
+                break
+
+        self.flush()
+        print(f"Thank you for using {self.name} v{self.version}")